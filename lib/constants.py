@@ -37,25 +37,22 @@
 # are not actually used in this module.
 
 import re
-import socket
 
 from ganeti._constants import *
 from ganeti._vcsversion import *
-from ganeti import compat
 from ganeti import pathutils
 
 ALLOCATABLE_KEY = "allocatable"
 FAILED_KEY = "failed"
 
 DAEMONS_LOGFILES = \
-    dict((daemon, pathutils.GetLogFilename(DAEMONS_LOGBASE[daemon]))
-         for daemon in DAEMONS_LOGBASE)
+    {daemon: pathutils.GetLogFilename(logbase)
+     for (daemon, logbase) in DAEMONS_LOGBASE.items()}
 
 DAEMONS_EXTRA_LOGFILES = \
-  dict((daemon, dict((extra,
-       pathutils.GetLogFilename(DAEMONS_EXTRA_LOGBASE[daemon][extra]))
-       for extra in DAEMONS_EXTRA_LOGBASE[daemon]))
-         for daemon in DAEMONS_EXTRA_LOGBASE)
+    {daemon: {extra: pathutils.GetLogFilename(logbase)
+              for (extra, logbase) in extra_logbases.items()}
+     for (daemon, extra_logbases) in DAEMONS_EXTRA_LOGBASE.items()}
 
 IE_MAGIC_RE = re.compile(r"^[-_.a-zA-Z0-9]{5,100}$")
 
@@ -73,4 +70,4 @@ JOB_FILE_RE = re.compile(r"^job-(%s)$" % JOB_ID_TEMPLATE)
 HVC_DEFAULTS[HT_XEN_HVM][HV_VNC_PASSWORD_FILE] = pathutils.VNC_PASSWORD_FILE
 
 # Do not re-export imported modules
-del re, socket, pathutils, compat
+del re, pathutils
@@ -40,6 +40,7 @@ import threading
 import itertools
 import operator
 import os
+import sys
 
 try:
   # pylint: disable=E0611
@@ -145,7 +146,10 @@ class _QueuedOpCode(object):
     """
     obj = _QueuedOpCode.__new__(cls)
     obj.input = opcodes.OpCode.LoadOpCode(state["input"])
-    obj.status = state["status"]
+    # Statuses decoded from JSON are fresh string objects; interning them
+    # lets the many comparisons against the status constants succeed on
+    # identity
+    obj.status = sys.intern(state["status"])
     obj.result = state["result"]
     obj.log = state["log"]
     obj.start_timestamp = state.get("start_timestamp", None)
@@ -352,25 +356,27 @@ class _QueuedJob(object):
 
     all_success = True
     for op in self.ops:
-      if op.status == constants.OP_STATUS_SUCCESS:
+      op_status = op.status
+
+      if op_status == constants.OP_STATUS_SUCCESS:
         continue
 
       all_success = False
 
-      if op.status == constants.OP_STATUS_QUEUED:
+      if op_status == constants.OP_STATUS_QUEUED:
         pass
-      elif op.status == constants.OP_STATUS_WAITING:
+      elif op_status == constants.OP_STATUS_WAITING:
         status = constants.JOB_STATUS_WAITING
-      elif op.status == constants.OP_STATUS_RUNNING:
+      elif op_status == constants.OP_STATUS_RUNNING:
         status = constants.JOB_STATUS_RUNNING
-      elif op.status == constants.OP_STATUS_CANCELING:
+      elif op_status == constants.OP_STATUS_CANCELING:
         status = constants.JOB_STATUS_CANCELING
         break
-      elif op.status == constants.OP_STATUS_ERROR:
+      elif op_status == constants.OP_STATUS_ERROR:
         status = constants.JOB_STATUS_ERROR
         # The whole job fails if one opcode failed
         break
-      elif op.status == constants.OP_STATUS_CANCELED:
+      elif op_status == constants.OP_STATUS_CANCELED:
         status = constants.OP_STATUS_CANCELED
         break
 
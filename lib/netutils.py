@@ -362,10 +362,11 @@ def GetDaemonPort(daemon_name):
   @rtype: int
 
   """
-  if daemon_name not in constants.DAEMONS_PORTS:
+  try:
+    (proto, default_port) = constants.DAEMONS_PORTS[daemon_name]
+  except KeyError:
     raise errors.ProgrammerError("Unknown daemon: %s" % daemon_name)
 
-  (proto, default_port) = constants.DAEMONS_PORTS[daemon_name]
   try:
     port = socket.getservbyname(daemon_name, proto)
   except socket.error:
@@ -1684,7 +1684,9 @@ class Cluster(TaggableObject):
     # pylint: disable=E0203
     # because these are "defined" via slots, not manually
     if self.hvparams is None:
-      self.hvparams = constants.HVC_DEFAULTS
+      # Never alias the module-level defaults, later modifications of the
+      # cluster's parameters would otherwise change them for everyone
+      self.hvparams = copy.deepcopy(constants.HVC_DEFAULTS)
     else:
       for hypervisor in constants.HYPER_TYPES:
         try:
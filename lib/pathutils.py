@@ -59,20 +59,20 @@ SHAREDIR = _constants.SHAREDIR
 LOCALSTATEDIR = vcluster.AddNodePrefix(_constants.LOCALSTATEDIR)
 
 # Paths which don't change for a virtual cluster
-DAEMON_UTIL = _constants.PKGLIBDIR + "/daemon-util"
-IMPORT_EXPORT_DAEMON = _constants.PKGLIBDIR + "/import-export"
-KVM_CONSOLE_WRAPPER = _constants.PKGLIBDIR + "/tools/kvm-console-wrapper"
-KVM_IFUP = _constants.PKGLIBDIR + "/kvm-ifup"
-PREPARE_NODE_JOIN = _constants.PKGLIBDIR + "/prepare-node-join"
-SSH_UPDATE = _constants.PKGLIBDIR + "/ssh-update"
-NODE_DAEMON_SETUP = _constants.PKGLIBDIR + "/node-daemon-setup"
-SSL_UPDATE = _constants.PKGLIBDIR + "/ssl-update"
-XEN_CONSOLE_WRAPPER = _constants.PKGLIBDIR + "/tools/xen-console-wrapper"
-CFGUPGRADE = _constants.PKGLIBDIR + "/tools/cfgupgrade"
-POST_UPGRADE = _constants.PKGLIBDIR + "/tools/post-upgrade"
-ENSURE_DIRS = _constants.PKGLIBDIR + "/ensure-dirs"
+DAEMON_UTIL = PKGLIBDIR + "/daemon-util"
+IMPORT_EXPORT_DAEMON = PKGLIBDIR + "/import-export"
+KVM_CONSOLE_WRAPPER = PKGLIBDIR + "/tools/kvm-console-wrapper"
+KVM_IFUP = PKGLIBDIR + "/kvm-ifup"
+PREPARE_NODE_JOIN = PKGLIBDIR + "/prepare-node-join"
+SSH_UPDATE = PKGLIBDIR + "/ssh-update"
+NODE_DAEMON_SETUP = PKGLIBDIR + "/node-daemon-setup"
+SSL_UPDATE = PKGLIBDIR + "/ssl-update"
+XEN_CONSOLE_WRAPPER = PKGLIBDIR + "/tools/xen-console-wrapper"
+CFGUPGRADE = PKGLIBDIR + "/tools/cfgupgrade"
+POST_UPGRADE = PKGLIBDIR + "/tools/post-upgrade"
+ENSURE_DIRS = PKGLIBDIR + "/ensure-dirs"
 # Script to configure the metadata virtual network interface with Xen
-XEN_VIF_METAD_SETUP = _constants.PKGLIBDIR + "/vif-ganeti-metad"
+XEN_VIF_METAD_SETUP = PKGLIBDIR + "/vif-ganeti-metad"
 ETC_HOSTS = vcluster.ETC_HOSTS
 
 # Top-level paths
@@ -708,8 +708,9 @@ class CfgUpgrade(object):
           disk["nodes"] = []
 
   def UpgradeAll(self):
-    self.config_data["version"] = version.BuildVersion(TARGET_MAJOR,
-                                                       TARGET_MINOR, 0)
+    # CONFIG_VERSION is computed at build time and equals
+    # BuildVersion(TARGET_MAJOR, TARGET_MINOR, 0)
+    self.config_data["version"] = constants.CONFIG_VERSION
     self.UpgradeRapiUsers()
     self.UpgradeWatcher()
     steps = [self.UpgradeFileStoragePaths,
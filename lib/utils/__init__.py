@@ -100,14 +100,15 @@ def ForceDictType(target, key_types, allowed_values=None):
     raise errors.TypeEnforcementError(msg)
 
   for key in target:
-    if key not in key_types:
+    # A single lookup both validates the key and fetches its type
+    ktype = key_types.get(key)
+    if ktype is None:
       msg = "Unknown parameter '%s'" % key
       raise errors.TypeEnforcementError(msg)
 
     if target[key] in allowed_values:
       continue
 
-    ktype = key_types[key]
     if ktype not in constants.ENFORCEABLE_TYPES:
       msg = "'%s' has non-enforceable type %s" % (key, ktype)
       raise errors.ProgrammerError(msg)
@@ -64,12 +64,9 @@ def BuildVersion(major, minor, revision):
   Returns: int representing version number
 
   """
-  assert isinstance(major, int)
-  assert isinstance(minor, int)
-  assert isinstance(revision, int)
-  return (1000000 * major +
-            10000 * minor +
-                1 * revision)
+  # pylint: disable=C0123
+  assert type(major) is type(minor) is type(revision) is int
+  return major * 1000000 + minor * 10000 + revision
 
 
 def SplitVersion(version):
@@ -78,12 +75,12 @@ def SplitVersion(version):
   Returns: tuple; (major, minor, revision)
 
   """
-  assert isinstance(version, int)
+  # pylint: disable=C0123
+  assert type(version) is int
 
-  (major, remainder) = divmod(version, 1000000)
-  (minor, revision) = divmod(remainder, 10000)
-
-  return (major, minor, revision)
+  # Plain floor division and modulo avoid building the intermediate tuples
+  # divmod would return
+  return (version // 1000000, version // 10000 % 100, version % 10000)
 
 
 def ParseVersion(versionstring):
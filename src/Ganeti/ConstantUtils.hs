@@ -38,6 +38,7 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 module Ganeti.ConstantUtils where
 
 import Data.Char (ord)
+import Data.List (intercalate)
 import Data.Set (Set)
 import qualified Data.Set as Set (difference, fromList, toList, union)
 import qualified Data.Semigroup as Sem
@@ -77,8 +78,14 @@ instance (Ord a) => Monoid (FrozenSet a) where
 -- fault' due to the presence of more than one instance of 'Set',
 -- namely, this one and the one in 'Ganeti.OpCodes'.  For this reason,
 -- we wrap 'Set' into 'FrozenSet'.
+--
+-- The elements are passed as a tuple rather than a list, so that the
+-- Python compiler can fold them into a single constant and importing
+-- the generated module does not build a throwaway list for every set.
 instance PyValue a => PyValue (FrozenSet a) where
-  showValue s = "frozenset(" ++ showValue (Set.toList (unFrozenSet s)) ++ ")"
+  showValue s = "frozenset(" ++ showTuple (Set.toList (unFrozenSet s)) ++ ")"
+    where showTuple [x] = "(" ++ showValue x ++ ",)"
+          showTuple xs = "(" ++ intercalate "," (map showValue xs) ++ ")"
 
 mkSet :: Ord a => [a] -> FrozenSet a
 mkSet = FrozenSet . Set.fromList
@@ -62,7 +62,7 @@ class TestConstants(unittest.TestCase):
     self.assertTrue(version.BuildVersion(12, 34, 5678) == 12345678)
     self.assertTrue(version.BuildVersion(99, 99, 9999) == 99999999)
 
-    self.assertTrue(version.SplitVersion(00000000) == (0, 0, 0))
+    self.assertTrue(version.SplitVersion(0) == (0, 0, 0))
     self.assertTrue(version.SplitVersion(10101010) == (10, 10, 1010))
     self.assertTrue(version.SplitVersion(12345678) == (12, 34, 5678))
     self.assertTrue(version.SplitVersion(99999999) == (99, 99, 9999))
@@ -257,6 +257,14 @@ class TestClusterObject(unittest.TestCase):
     cluster = objects.Cluster(ipolicy={"unknown_key": None})
     self.assertRaises(errors.ConfigurationError, cluster.UpgradeConfig)
 
+  def testUpgradeConfigDoesNotAliasHvDefaults(self):
+    cluster = objects.Cluster()
+    cluster.UpgradeConfig()
+    self.assertEqual(cluster.hvparams, constants.HVC_DEFAULTS)
+    self.assertFalse(cluster.hvparams is constants.HVC_DEFAULTS)
+    for hv in constants.HYPER_TYPES:
+      self.assertFalse(cluster.hvparams[hv] is constants.HVC_DEFAULTS[hv])
+
   def testUpgradeEnabledDiskTemplates(self):
     cfg = objects.ConfigData()
     cfg.cluster = objects.Cluster()
@@ -45,6 +45,16 @@ class ParseVersionTest(unittest.TestCase):
         self.assertEqual(version.ParseVersion("2"), None)
         self.assertEqual(version.ParseVersion("pink bunny"), None)
 
+class BuildSplitVersionTest(unittest.TestCase):
+    def testRoundTrip(self):
+        for v in [(0, 0, 0), (2, 16, 0), (3, 0, 0), (3, 1, 42),
+                  (12, 34, 5678), (99, 99, 9999)]:
+            self.assertEqual(version.SplitVersion(version.BuildVersion(*v)), v)
+
+    def testDecimalFormat(self):
+        self.assertEqual(version.BuildVersion(2, 16, 0), 2160000)
+        self.assertEqual(version.SplitVersion(3000000), (3, 0, 0))
+
 class UpgradeRangeTest(unittest.TestCase):
     def testUpgradeRange(self):
         self.assertEqual(version.UpgradeRange((2,11,0), current=(2,10,0)),